@@ -9,6 +9,7 @@ from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 from utils import validate_room_data, save_uploaded_file, allowed_file
 from database import create_user, get_user_by_username, get_user_by_id, save_room, get_user_rooms, get_room_by_id, update_room, delete_room, save_signup_otp, get_signup_otp, delete_signup_otp
+from cleanup import start_reaper
 from bson import ObjectId
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
@@ -507,4 +508,5 @@ def is_valid_password(password):
 
 if __name__ == '__main__':
     ensure_directories() # Initialize database on startup
+    start_reaper(WALLPAPERS_DIR) # Periodically remove orphaned uploads and expired OTPs
     app.run(host='0.0.0.0', port=5000)
@@ -0,0 +1,128 @@
+import os
+import re
+import time
+import threading
+from database import iter_room_assets, delete_expired_signup_otps
+
+# Retention settings (override via environment)
+UPLOAD_RETENTION_DAYS = float(os.environ.get('UPLOAD_RETENTION_DAYS', 7))
+REAPER_INTERVAL_SECONDS = int(os.environ.get('REAPER_INTERVAL_SECONDS', 3600))
+REAPER_BATCH_SIZE = int(os.environ.get('REAPER_BATCH_SIZE', 500))
+REAPER_DRY_RUN = os.environ.get('REAPER_DRY_RUN', '').lower() in ('1', 'true', 'yes')
+
+WALLPAPER_URL_RE = re.compile(r"/api/wallpapers/([^/?#\"'\s]+)")
+
+
+def _collect_strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _collect_strings(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _collect_strings(v)
+
+
+def collect_referenced_files(batch_size=REAPER_BATCH_SIZE):
+    """Return the set of upload filenames referenced by any saved room"""
+    referenced = set()
+    for room in iter_room_assets(batch_size):
+        for value in _collect_strings(room):
+            if value.startswith('data:'):
+                continue
+            referenced.update(WALLPAPER_URL_RE.findall(value))
+            # Rooms may also store the bare filename returned on upload
+            if os.path.basename(value) == value and '.' in value:
+                referenced.add(value)
+    return referenced
+
+
+def iter_upload_batches(upload_folder, batch_size=REAPER_BATCH_SIZE):
+    """Yield lists of regular-file DirEntry objects without listing the whole directory"""
+    if not os.path.isdir(upload_folder):
+        return
+    batch = []
+    with os.scandir(upload_folder) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def reap_uploads(upload_folder, retention_days=UPLOAD_RETENTION_DAYS, dry_run=REAPER_DRY_RUN, batch_size=REAPER_BATCH_SIZE):
+    """Delete uploads that no room references and that are older than the retention window"""
+    now = time.time()
+    cutoff = now - retention_days * 86400
+    referenced = collect_referenced_files(batch_size)
+    report = {
+        'dry_run': dry_run,
+        'scanned': 0,
+        'deleted_files': 0,
+        'freed_bytes': 0,
+        'expired_otps': 0,
+        'errors': 0
+    }
+    for batch in iter_upload_batches(upload_folder, batch_size):
+        for entry in batch:
+            report['scanned'] += 1
+            if entry.name in referenced:
+                continue
+            try:
+                stat = entry.stat(follow_symlinks=False)
+                if stat.st_mtime > cutoff:
+                    continue
+                if not dry_run:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                print(f"❌ Error removing {entry.path}:", e)
+                report['errors'] += 1
+                continue
+            report['deleted_files'] += 1
+            report['freed_bytes'] += stat.st_size
+    report['expired_otps'] = delete_expired_signup_otps(now, dry_run=dry_run)
+    return report
+
+
+def _reaper_loop(upload_folder, interval, stop_event, **kwargs):
+    while not stop_event.is_set():
+        try:
+            report = reap_uploads(upload_folder, **kwargs)
+            prefix = "🧹 [dry-run]" if report['dry_run'] else "🧹"
+            print(f"{prefix} Reaped {report['deleted_files']}/{report['scanned']} files, "
+                  f"freed {report['freed_bytes']} bytes, {report['expired_otps']} expired OTPs")
+        except Exception as e:
+            print("❌ Error during upload cleanup:", e)
+        stop_event.wait(interval)
+
+
+def start_reaper(upload_folder, interval=REAPER_INTERVAL_SECONDS, **kwargs):
+    """Run reap_uploads periodically in a daemon thread; set the returned event to stop it"""
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=_reaper_loop,
+        args=(upload_folder, interval, stop_event),
+        kwargs=kwargs,
+        name='upload-reaper',
+        daemon=True
+    )
+    thread.start()
+    return stop_event
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Remove unreferenced uploads and expired signup OTPs')
+    parser.add_argument('--dir', default='wallpapers', help='Upload directory to scan')
+    parser.add_argument('--retention-days', type=float, default=UPLOAD_RETENTION_DAYS)
+    parser.add_argument('--batch-size', type=int, default=REAPER_BATCH_SIZE)
+    parser.add_argument('--dry-run', action='store_true', default=REAPER_DRY_RUN)
+    args = parser.parse_args()
+    print(reap_uploads(args.dir, retention_days=args.retention_days, dry_run=args.dry_run, batch_size=args.batch_size))
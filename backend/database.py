@@ -114,3 +114,18 @@ def get_signup_otp(email):
 
 def delete_signup_otp(email):
     db.signup_otps.delete_one({"email": email})
+
+def delete_expired_signup_otps(now, dry_run=False):
+    query = {"expiry": {"$lt": now}}
+    if dry_run:
+        return db.signup_otps.count_documents(query)
+    return db.signup_otps.delete_many(query).deleted_count
+
+# CLEANUP
+
+def iter_room_assets(batch_size=100):
+    """Yield the asset-bearing fields of every room, fetched in batches"""
+    projection = {"wallpapers": 1, "wall_canvas_data": 1, "walls": 1}
+    cursor = db.rooms.find({}, projection).batch_size(batch_size)
+    for room in cursor:
+        yield room